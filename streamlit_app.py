@@ -1,44 +1,119 @@
+import asyncio
+import codecs
+import hashlib
+import html
+import ipaddress
 import os
+import re
+import socket
+import sqlite3
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
-from openai import OpenAI, APIError
+import aiohttp
+import orjson
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+from openai import OpenAI, APIConnectionError, APIError, APITimeoutError
 import time
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterator, List, Mapping, Tuple
+from urllib.parse import urljoin, urlsplit
 
 # --- LLM Configuration Mappings ---
+@dataclass(frozen=True)
+class LLMConfig:
+    """API characteristics of a supported LLM provider."""
+    is_remote: bool
+    base_url: str
+    default_model: str
+    secret_key_name: str = ""
+    env_key_name: str = ""
+
+
 # Define supported providers and their API characteristics
-LLM_CONFIGS = {
-    "OpenAI": {
-        "is_remote": True,
-        "base_url": "https://api.openai.com/v1",
-        "default_model": "gpt-4o-mini",
-        "secret_key_name": "OPENAI_API_KEY",
-        "env_key_name": "OPENAI_API_KEY",
-    },
-    "OpenRouter": {
-        "is_remote": True,
-        "base_url": "https://openrouter.ai/api/v1",
-        "default_model": "nousresearch/nous-hermes-2-mixtral-8x7b-dpo",
-        "secret_key_name": "OPENROUTER_API_KEY",
-        "env_key_name": "OPENROUTER_API_KEY",
-    },
-    "Ollama (Local)": {
-        "is_remote": False,
-        "base_url": "http://localhost:11434/v1", # Default endpoint URL for Ollama
-        "default_model": "llama2",
-    }
+LLM_CONFIGS: Dict[str, LLMConfig] = {
+    "OpenAI": LLMConfig(
+        is_remote=True,
+        base_url="https://api.openai.com/v1",
+        default_model="gpt-4o-mini",
+        secret_key_name="OPENAI_API_KEY",
+        env_key_name="OPENAI_API_KEY",
+    ),
+    "OpenRouter": LLMConfig(
+        is_remote=True,
+        base_url="https://openrouter.ai/api/v1",
+        default_model="nousresearch/nous-hermes-2-mixtral-8x7b-dpo",
+        secret_key_name="OPENROUTER_API_KEY",
+        env_key_name="OPENROUTER_API_KEY",
+    ),
+    "Ollama (Local)": LLMConfig(
+        is_remote=False,
+        base_url="http://localhost:11434/v1", # Default endpoint URL for Ollama
+        default_model="llama2",
+    )
 }
 
+# Model IDs containing any of these markers are not chat models and are hidden from the picker
+# (kept specific: "audio" alone would also hide chat models like gpt-4o-audio-preview)
+NON_CHAT_MODEL_MARKERS = ("embed", "whisper", "tts", "dall-e", "moderation", "transcribe", "realtime")
+# How long a model list is reused before it is fetched again
+MODEL_LIST_REFRESH = 3600 # seconds
+
+# --- Scraping Configuration ---
+# Request headers sent with every scrape (read-only; applied to the pooled sessions once)
+HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/117.0.0.0 Safari/537.36"
+})
+# Upper bound on bytes read from a page body before parsing
+MAX_CONTENT_BYTES = 2_000_000
+# Redirects are followed by hand so every hop can be re-validated
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# Elements stripped from the page before extracting text
+NOISE_TAGS = ("script", "style", "img", "input", "nav", "footer", "header")
+# Compiled once: every text node under an element, as plain str (no lxml "smart string" overhead)
+_TEXT_NODES = etree.XPath(".//text()", smart_strings=False)
+# <meta charset="..."> / <meta http-equiv="Content-Type" content="...; charset=..."> in the page head
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+# Fast path for the title: read it from the raw bytes rather than the parsed tree
+_TITLE_RE = re.compile(rb"<title[^>]*>([^<]{0,300})</title>", re.IGNORECASE)
+# Plain hostname or IPv4 address with an optional port (no credentials, no IPv6 literals)
+_NETLOC_RE = re.compile(r"^[A-Za-z0-9.\-]+(:\d+)?$")
+# Maximum number of pages fetched at once in batch mode
+BATCH_CONCURRENCY = 5
+
+# Retry policy shared by the requests session and the aiohttp batch path
+FETCH_RETRIES = 3
+RETRY_BACKOFF = 0.3
+# Page text sent to the LLM is cut to this many characters (roughly 3k tokens)
+MAX_PROMPT_CHARS = 12_000
+# On-disk cache of scraped pages that survives app restarts
+# One SQLite file next to the app holds both the page cache and the completion cache
+CACHE_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".streamlit", "page_cache.sqlite3")
+PAGE_CACHE_TTL = 3600 # seconds
+PAGE_CACHE_MAX_AGE = 24 * 3600 # seconds; stale rows are kept this long for revalidation, then pruned
+COMPLETION_CACHE_TTL = 7 * 24 * 3600 # seconds
+COMPLETION_CACHE_MAX_ENTRIES = 256
+
 # --- Session State Initialization ---
 if "api_key" not in st.session_state:
     st.session_state["api_key"] = ""
 if "endpoint_url" not in st.session_state:
-    st.session_state["endpoint_url"] = LLM_CONFIGS["Ollama (Local)"]["base_url"]
+    st.session_state["endpoint_url"] = LLM_CONFIGS["Ollama (Local)"].base_url
 if "llm_provider" not in st.session_state:
     st.session_state["llm_provider"] = "OpenAI"
 if "selected_model" not in st.session_state:
-    st.session_state["selected_model"] = LLM_CONFIGS["OpenAI"]["default_model"]
+    st.session_state["selected_model"] = LLM_CONFIGS["OpenAI"].default_model
 
 
 # Page configuration
@@ -85,6 +160,53 @@ st.markdown("""
 
 # --- Utility Functions ---
 
+class ScrapeError(Exception):
+    """A scrape failure whose message is already phrased for the user."""
+
+
+def is_public_address(address: str) -> bool:
+    """False for private, loopback, link-local, reserved, multicast and unspecified IPs."""
+    ip = ipaddress.ip_address(address.split("%", 1)[0]) # Drop any IPv6 zone index
+    return not (
+        ip.is_private or ip.is_loopback or ip.is_link_local
+        or ip.is_reserved or ip.is_multicast or ip.is_unspecified
+    )
+
+
+def validate_url(url: str) -> str:
+    """
+    Reject malformed URLs and any host that resolves to an internal address.
+    Raises ValueError with a user-facing message; returns the URL unchanged otherwise.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc or not _NETLOC_RE.match(parts.netloc):
+        raise ValueError(f"Please enter a valid URL starting with http:// or https:// (got: {url})")
+
+    # SSRF pre-check: resolve the host the way the HTTP client will, so shorthand and
+    # numeric forms (127.1, 2130706433, 0x7f.1) and DNS names pointing inward are caught.
+    # The clients resolve again when connecting, so the HTTP session and the batch
+    # resolver repeat the check on the address actually used (DNS rebinding).
+    host = parts.hostname or ""
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parts.port or None, proto=socket.IPPROTO_TCP)}
+    except (socket.gaierror, UnicodeError):
+        raise ValueError(f"Could not resolve host: {url}")
+    if not all(map(is_public_address, addresses)):
+        raise ValueError(f"Refusing to scrape a private or reserved address: {url}")
+    return url
+
+
+def checked_redirect(url: str, location: str) -> str:
+    """
+    Resolve a redirect Location against the current URL and re-run validate_url on it.
+    Raises ScrapeError so a blocked hop is reported like any other scrape failure.
+    """
+    target = urljoin(url, location)
+    try:
+        return validate_url(target)
+    except ValueError as e:
+        raise ScrapeError(f"Blocked redirect: {e}") from e
+
 def get_api_key(provider: str) -> str:
     """Retrieves the API key from session state, then secrets, then environment."""
     
@@ -92,9 +214,19 @@ def get_api_key(provider: str) -> str:
     if st.session_state.get("api_key"):
         return st.session_state["api_key"]
 
-    config = LLM_CONFIGS.get(provider, {})
-    secret_key = config.get("secret_key_name", "")
-    env_key = config.get("env_key_name", "")
+    return _resolve_configured_key(provider)
+
+@st.cache_resource(show_spinner=False, ttl=60)
+def _resolve_configured_key(provider: str) -> str:
+    """
+    Looks up the provider key in secrets, then environment, at most once a minute,
+    so a rotated secret or environment variable is picked up without a restart.
+    User-entered keys are handled by get_api_key and never land in this shared cache;
+    a missing key raises and is therefore re-checked on the next call.
+    """
+    config = LLM_CONFIGS.get(provider)
+    secret_key = config.secret_key_name if config else ""
+    env_key = config.env_key_name if config else ""
 
     # 2. Check Streamlit secrets
     key = st.secrets.get(secret_key)
@@ -111,96 +243,666 @@ def get_api_key(provider: str) -> str:
         f"API key not found. Please enter your {provider} key in the sidebar."
     )
 
-@st.cache_data(ttl=3600, show_spinner=False)
+# Bounded: every distinct key/endpoint a user types in gets its own client
+@st.cache_resource(show_spinner=False, max_entries=32, ttl=3600)
+def get_llm_client(provider: str, base_url: str, api_key: str) -> OpenAI:
+    """
+    Builds an OpenAI-compatible client, reused so its connection pool stays warm.
+    Clients are rebuilt after an hour and the least recently used go once 32 are cached.
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
 def fetch_available_models(provider: str, api_key: str) -> List[str]:
-    """Fetches the list of available models for a given provider/key from API."""
-    if provider not in LLM_CONFIGS or not LLM_CONFIGS[provider]["is_remote"]:
+    """
+    Fetches the list of available chat models for a given provider/key from API.
+    Lists are kept in the on-disk cache for MODEL_LIST_REFRESH seconds, so restarts
+    and other sessions don't re-query /models. Makes no st.* UI calls so it can run in
+    a background thread; API errors propagate to the caller and are never cached.
+    """
+    config = LLM_CONFIGS.get(provider)
+    if config is None or not config.is_remote:
         return []
 
-    config = LLM_CONFIGS[provider]
-    base_url = config['base_url']
+    # Keyed on a digest, so the raw API key is never written to disk
+    cache_key = make_cache_key(provider, config.base_url, api_key)
+    cached_models = load_cached_models(cache_key)
+    if cached_models is not None:
+        return cached_models
+
+    # Use the OpenAI client to query the /models endpoint
+    client = get_llm_client(provider, config.base_url, api_key)
+    # Bounded so a hung endpoint surfaces as APITimeoutError instead of a spinner that never ends
+    models_response = client.models.list(timeout=30)
+    
+    # Drop embedding/audio/image models so only chat-capable options are offered
+    model_names = [
+        m.id for m in models_response.data
+        if not any(marker in m.id.lower() for marker in NON_CHAT_MODEL_MARKERS)
+    ]
+    
+    model_names.sort()
+    store_cached_models(cache_key, model_names)
+    return model_names
+
+def model_cache_bucket() -> int:
+    """
+    The current MODEL_LIST_REFRESH-sized time window; part of the session's prefetch
+    key so a long-lived session fetches a fresh list once its window rolls over.
+    """
+    return int(time.time() // MODEL_LIST_REFRESH)
+
+@st.cache_resource(show_spinner=False)
+def get_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for background I/O (e.g. model-list refreshes)."""
+    return ThreadPoolExecutor(max_workers=4)
+
+def prefetch_models(provider: str, api_key: str) -> Future:
+    """
+    Starts (or reuses) a background fetch of the model list for provider/api_key.
+    The future is kept in session state so later reruns pick up the finished result;
+    llm_config_selector drops it once a failure has been shown, so the next rerun retries.
+    """
+    bucket = model_cache_bucket()
+    pending = st.session_state.get("models_future")
+    if pending and pending[:3] == (provider, api_key, bucket):
+        return pending[3]
     
+    future = get_executor().submit(fetch_available_models, provider, api_key)
+    st.session_state["models_future"] = (provider, api_key, bucket, future)
+    return future
+
+class _PublicPeerMixin:
+    """
+    Checks the peer of every new socket before anything is sent on it, so a host that
+    re-resolves to an internal address after validate_url (DNS rebinding) is refused.
+    """
+    def _new_conn(self):
+        sock = super()._new_conn()
+        address = sock.getpeername()[0]
+        if not is_public_address(address):
+            sock.close()
+            raise ScrapeError(f"Refusing to scrape a private or reserved address: {self.host} resolved to {address}")
+        return sock
+
+class _PublicHTTPConnection(_PublicPeerMixin, HTTPConnection):
+    pass
+
+class _PublicHTTPSConnection(_PublicPeerMixin, HTTPSConnection):
+    pass
+
+class _PublicHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _PublicHTTPConnection
+
+class _PublicHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _PublicHTTPSConnection
+
+class PublicOnlyAdapter(HTTPAdapter):
+    """HTTPAdapter whose direct (non-proxy) connections only ever reach public addresses."""
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _PublicHTTPConnectionPool,
+            "https": _PublicHTTPSConnectionPool
+        }
+
+class PublicOnlyResolver(aiohttp.ThreadedResolver):
+    """
+    aiohttp resolver that refuses hosts resolving to non-public addresses. The
+    connector only connects to what this returns, so the check can't be rebound.
+    """
+    async def resolve(self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET):
+        addresses = await super().resolve(host, port, family)
+        if not all(is_public_address(address["host"]) for address in addresses):
+            raise ScrapeError(f"Refusing to scrape a private or reserved address: {host}")
+        return addresses
+
+@st.cache_resource(show_spinner=False)
+def get_http_session() -> requests.Session:
+    """Builds a pooled HTTP session that is shared across reruns and users."""
+    session = requests.Session()
+
+    # Keep-alive connection pool with light retry/backoff for flaky hosts
+    adapter = PublicOnlyAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(total=FETCH_RETRIES, backoff_factor=RETRY_BACKOFF)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers.update(HEADERS)
+    return session
+
+@st.cache_resource(show_spinner=False)
+def _init_cache_db() -> str:
+    """Creates the on-disk cache tables once per process and returns the database path."""
+    os.makedirs(os.path.dirname(CACHE_DB_PATH), exist_ok=True)
+    with closing(sqlite3.connect(CACHE_DB_PATH)) as conn, conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, title TEXT, text TEXT, fetched_at REAL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        # Upgrade caches created before the validator columns existed
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(pages)")}
+        for column in ("etag", "last_modified"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE pages ADD COLUMN {column} TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS pages_fetched_at ON pages (fetched_at)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "cache_key TEXT PRIMARY KEY, summary TEXT, created_at REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS completions_created_at ON completions (created_at)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS model_lists ("
+            "cache_key TEXT PRIMARY KEY, models TEXT, fetched_at REAL)"
+        )
+    return CACHE_DB_PATH
+
+def _connect_cache_db() -> sqlite3.Connection:
+    # Short busy timeout: a locked cache should cost a refetch, not a stalled scrape
+    return sqlite3.connect(_init_cache_db(), timeout=1)
+
+def load_cached_page(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the stored title/text/fetched_at and HTTP validators (etag, last_modified)
+    for url, or None if it was never cached or the cache is unavailable.
+    """
     try:
-        # Use the OpenAI client to query the /models endpoint
-        client = OpenAI(api_key=api_key, base_url=base_url)
-        models_response = client.models.list()
-        
-        model_names = [m.id for m in models_response.data]
-        
-        # Simple sorting and return
-        return sorted(model_names)
+        with closing(_connect_cache_db()) as conn:
+            row = conn.execute(
+                "SELECT title, text, fetched_at, etag, last_modified FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None # The cache is only an optimisation; fall back to a normal fetch
+    if row is None:
+        return None
+    return {
+        "title": row[0],
+        "text": row[1],
+        "fetched_at": row[2],
+        "etag": row[3],
+        "last_modified": row[4]
+    }
+
+def store_cached_page(
+    url: str,
+    title: str,
+    text: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None
+):
+    """
+    Inserts or refreshes the stored copy of a successfully scraped page and prunes
+    rows older than PAGE_CACHE_MAX_AGE. Cache failures are ignored.
+    """
+    now = time.time()
+    try:
+        with closing(_connect_cache_db()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages (url, title, text, fetched_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, title, text, now, etag, last_modified)
+            )
+            conn.execute("DELETE FROM pages WHERE fetched_at < ?", (now - PAGE_CACHE_MAX_AGE,))
+    except (sqlite3.Error, OSError):
+        pass # The page was scraped fine; it just won't be cached
+
+def is_fresh(cached: Optional[Dict[str, Any]]) -> bool:
+    """True if a load_cached_page row is recent enough to serve without revalidation."""
+    return cached is not None and time.time() - cached["fetched_at"] < PAGE_CACHE_TTL
+
+def conditional_headers(cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    If-None-Match / If-Modified-Since headers built from a cached row's validators,
+    asking the server to skip the body if the page hasn't changed since we stored it.
+    """
+    headers = {}
+    if cached and cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached["last_modified"]:
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+def store_scraped_page(url: str, page: Dict[str, str], response_headers: Mapping[str, str]):
+    """Stores a freshly parsed page together with the validators from its response."""
+    store_cached_page(
+        url,
+        page["title"],
+        page["text"],
+        response_headers.get("ETag"),
+        response_headers.get("Last-Modified")
+    )
+
+def refresh_cached_page(
+    url: str,
+    cached: Dict[str, Any],
+    response_headers: Mapping[str, str]
+) -> Dict[str, str]:
+    """
+    Handles a 304: restarts the cached row's freshness window (keeping any updated
+    validators) and returns its title and text.
+    """
+    store_cached_page(
+        url,
+        cached["title"],
+        cached["text"],
+        response_headers.get("ETag", cached["etag"]),
+        response_headers.get("Last-Modified", cached["last_modified"])
+    )
+    return {"title": cached["title"], "text": cached["text"]}
+
+def detect_encoding(raw: bytes, declared: Optional[str] = None) -> str:
+    """
+    Picks the charset of a page body: the charset from the HTTP Content-Type header,
+    then <meta charset>, then UTF-8 if the bytes are valid UTF-8, then statistical
+    detection (what requests' apparent_encoding uses), finally windows-1252.
+    """
+    candidates = [declared]
+    match = _META_CHARSET_RE.search(raw, 0, 4096)
+    if match:
+        candidates.append(match.group(1).decode("ascii"))
+    
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            pass # Unknown label, try the next source
+    
+    try:
+        # Incremental decode so a multi-byte character cut off by the bounded read doesn't count
+        codecs.getincrementaldecoder("utf-8")().decode(raw, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    
+    detected = chardet.detect(raw[:65536]).get("encoding") if chardet else None
+    try:
+        return codecs.lookup(detected).name if detected else "windows-1252"
+    except LookupError:
+        return "windows-1252"
+
+def parse_html(raw: bytes, declared_encoding: Optional[str] = None) -> Dict[str, str]:
+    """
+    Parse raw HTML into its title and cleaned text.
+    declared_encoding is the charset from the HTTP Content-Type header, if any.
+    Kept free of I/O so it can run in a worker thread.
+    """
+    encoding = detect_encoding(raw, declared_encoding)
+    
+    # Decode with the detected charset ourselves and hand libxml2 UTF-8, so it never
+    # guesses (its fallback is Latin-1) and any charset Python knows is supported
+    tree = lxml.html.document_fromstring(
+        raw.decode(encoding, "replace").encode("utf-8"),
+        parser=lxml.html.HTMLParser(encoding="utf-8")
+    )
+    
+    # Extract title with a cheap regex on the raw bytes, decoded with the body's charset;
+    # fall back to the parsed <title> for long or unusual markup the regex misses
+    match = _TITLE_RE.search(raw)
+    if match:
+        title = html.unescape(match.group(1).decode(encoding, "replace"))
+    else:
+        title = tree.findtext(".//title") or ""
+    title = " ".join(title.split()) or "No title found"
+    
+    # Prefer the page's main content region over the whole document
+    # (lxml elements are falsy when childless, so compare against None explicitly)
+    content = next(
+        (el for el in (tree.find(".//main"), tree.find(".//article"), tree.find("body")) if el is not None),
+        tree
+    )
+    
+    # Remove irrelevant elements (and comments) in a single C-level tree walk
+    etree.strip_elements(content, etree.Comment, *NOISE_TAGS, with_tail=False)
+    
+    # Get clean text: trim each line and drop blank ones, all via C-level builtins
+    lines = "\n".join(_TEXT_NODES(content)).split("\n")
+    text = "\n".join(filter(None, map(str.strip, lines)))
+    
+    return {"title": title, "text": text}
+
+def _get_without_auto_redirects(url: str, headers: Dict[str, str]) -> requests.Response:
+    """
+    Stream a GET, following at most MAX_REDIRECTS redirects by hand.
+    Each Location goes through checked_redirect before it is requested.
+    """
+    session = get_http_session()
+    for _ in range(MAX_REDIRECTS + 1):
+        response = session.get(url, headers=headers, timeout=10, stream=True, allow_redirects=False)
+        if not response.is_redirect:
+            return response
+        response.close()
+        url = checked_redirect(url, response.headers["Location"])
+    raise ScrapeError(f"Too many redirects (limit is {MAX_REDIRECTS})")
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _fetch_page(url: str) -> Dict[str, str]:
+    """
+    Fetch and parse a page, returning its title and text.
+    Raises on any failure: Streamlit never caches exceptions, so a timeout or 5xx is
+    retried on the next call instead of being replayed for the cache lifetime.
+    Fresh copies in the on-disk page cache are served without any network I/O;
+    stale ones are revalidated with a conditional GET.
+    """
+    cached = load_cached_page(url)
+    if is_fresh(cached):
+        return {"title": cached["title"], "text": cached["text"]}
+    
+    with _get_without_auto_redirects(url, conditional_headers(cached)) as response:
+        if cached and response.status_code == 304:
+            # Unchanged: reuse the stored text and restart its freshness window
+            return refresh_cached_page(url, cached, response.headers)
         
-    except APIError as e:
-        # Catch authentication/rate limit errors
-        st.warning(f"Could not fetch models for {provider}. Check API key validity. Error Code: {e.status_code}")
-        return []
-    except Exception as e:
-        st.warning(f"An unexpected error occurred while fetching models: {e}")
-        return []
+        response.raise_for_status()
+
+        # Short-circuit pages that advertise a body larger than we are willing to read
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > MAX_CONTENT_BYTES:
+            raise ScrapeError(
+                f"Page too large: {int(content_length):,} bytes "
+                f"(limit is {MAX_CONTENT_BYTES:,} bytes)"
+            )
+
+        # Bounded read so oversized or unannounced bodies never fully land in memory
+        raw = response.raw.read(MAX_CONTENT_BYTES, decode_content=True)
+    
+    # Only trust response.encoding when the server actually sent a charset;
+    # otherwise requests defaults text/* to ISO-8859-1
+    declared = response.encoding if "charset=" in response.headers.get("Content-Type", "").lower() else None
+    parsed = parse_html(raw, declared)
+    store_scraped_page(url, parsed, response.headers)
+    return parsed
+
+
+def scrape_error(url: str, error: str) -> Dict[str, Any]:
+    """Builds the error result shared by scrape_and_clean and batch mode."""
+    return {
+        "title": None,
+        "text": None,
+        "url": url,
+        "status": "error",
+        "error": error
+    }
+
 
-# Caching decorator removed to resolve UnserializableReturnValueError
 def scrape_and_clean(url: str) -> Dict[str, Any]:
     """
-    Scrape and clean website content using BeautifulSoup.
+    Scrape and clean website content using lxml.
     Returns a dictionary with title, text, and metadata.
+    Successful pages are cached (see _fetch_page); failures are not.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/117.0.0.0 Safari/537.36"
-    }
+    try:
+        page = _fetch_page(url)
+    except ScrapeError as e:
+        return scrape_error(url, str(e))
+    except requests.exceptions.RequestException as e:
+        return scrape_error(url, f"Network error: {str(e)}")
+    except Exception as e:
+        return scrape_error(url, f"Parsing error: {str(e)}")
     
+    return {
+        **page,
+        "url": url,
+        "status": "success"
+    }
+
+
+async def _download(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Dict[str, str]
+) -> Tuple[Optional[bytes], Optional[str], Mapping[str, str]]:
+    """
+    Download a page body with the same size limit and redirect checks as the
+    synchronous path. Returns (body, charset, response headers); body is None when a
+    conditional request comes back 304 Not Modified.
+    """
+    loop = asyncio.get_running_loop()
+    for _ in range(MAX_REDIRECTS + 1):
+        async with session.get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=10),
+            allow_redirects=False
+        ) as response:
+            if response.status in REDIRECT_STATUSES and "Location" in response.headers:
+                # validate_url resolves DNS, which blocks, so keep it off the event loop
+                url = await loop.run_in_executor(None, checked_redirect, url, response.headers["Location"])
+                continue
+
+            if headers and response.status == 304:
+                return None, None, response.headers
+
+            response.raise_for_status()
+
+            if response.content_length and response.content_length > MAX_CONTENT_BYTES:
+                raise ScrapeError(
+                    f"Page too large: {response.content_length:,} bytes "
+                    f"(limit is {MAX_CONTENT_BYTES:,} bytes)"
+                )
+
+            # Same bounded read as the synchronous path
+            raw = bytearray()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                raw += chunk
+                if len(raw) >= MAX_CONTENT_BYTES:
+                    break
+
+        return bytes(raw[:MAX_CONTENT_BYTES]), response.charset, response.headers
+    raise ScrapeError(f"Too many redirects (limit is {MAX_REDIRECTS})")
+
+
+async def _fetch_one(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    url: str
+) -> Dict[str, Any]:
+    """
+    Fetch and parse a single page for batch mode.
+    Mirrors scrape_and_clean, including URL validation, the on-disk page cache and
+    conditional GET, its error dictionaries and the session's retry policy for
+    connection errors and timeouts.
+    """
+    loop = asyncio.get_running_loop()
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, "html.parser")
-        
-        # Extract title
-        title = soup.title.string if soup.title else "No title found"
-        
-        # Remove irrelevant elements
-        for element in soup(["script", "style", "img", "input", "nav", "footer", "header"]):
-            element.decompose()
-        
-        # Get clean text
-        text = soup.get_text(separator="\n", strip=True)
-        
-        # Clean up excessive whitespace
-        text = "\n".join(line.strip() for line in text.split("\n") if line.strip())
-        
+        # SQLite calls block, so they run in the executor like parsing does
+        cached = await loop.run_in_executor(None, load_cached_page, url)
+        if is_fresh(cached):
+            return {
+                "title": cached["title"],
+                "text": cached["text"],
+                "url": url,
+                "status": "success"
+            }
+
+        # validate_url resolves DNS; in the executor, so batch lookups overlap
+        try:
+            await loop.run_in_executor(None, validate_url, url)
+        except ValueError as e:
+            return scrape_error(url, str(e))
+
+        async with sem:
+            for attempt in range(FETCH_RETRIES + 1):
+                try:
+                    raw, charset, response_headers = await _download(session, url, conditional_headers(cached))
+                    break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == FETCH_RETRIES:
+                        raise
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+        if raw is None:
+            # 304: the stored copy is still current
+            parsed = await loop.run_in_executor(None, refresh_cached_page, url, cached, response_headers)
+        else:
+            # Parse off the event loop so other downloads keep progressing
+            parsed = await loop.run_in_executor(None, parse_html, raw, charset)
+            await loop.run_in_executor(None, store_scraped_page, url, parsed, response_headers)
+
         return {
-            "title": title,
-            "text": text,
+            **parsed,
             "url": url,
             "status": "success"
         }
-        
-    except requests.exceptions.RequestException as e:
-        # Explicitly cast exception message to string to prevent Streamlit cache errors (though caching is now disabled)
-        error_msg = str(e)
-        return {
-            "title": None,
-            "text": None,
-            "url": url,
-            "status": "error",
-            "error": f"Network error: {error_msg}"
-        }
+
+    except ScrapeError as e:
+        return scrape_error(url, str(e))
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return scrape_error(url, f"Network error: {str(e) or type(e).__name__}")
     except Exception as e:
-        # Explicitly cast exception message to string to prevent Streamlit cache errors (though caching is now disabled)
-        error_msg = str(e)
-        return {
-            "title": None,
-            "text": None,
-            "url": url,
-            "status": "error",
-            "error": f"Parsing error: {error_msg}"
-        }
+        return scrape_error(url, f"Parsing error: {str(e)}")
+
+
+async def _scrape_many_async(urls: List[str]) -> List[Dict[str, Any]]:
+    """Fetch all URLs over one shared aiohttp session, bounded by a semaphore."""
+    sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, resolver=PublicOnlyResolver())
+    async with aiohttp.ClientSession(connector=connector, headers=dict(HEADERS)) as session:
+        return await asyncio.gather(*[_fetch_one(session, sem, url) for url in urls])
+
+
+def scrape_many(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Scrape several websites concurrently (at most BATCH_CONCURRENCY at a time).
+    Returns one scrape_and_clean-style dictionary per URL, in input order.
+    Not cached as a batch, so one failed URL is retried on the next run.
+    """
+    return asyncio.run(_scrape_many_async(urls))
+
+
+def truncate_text(text: str, limit: int = MAX_PROMPT_CHARS) -> str:
+    """
+    Cut text to at most `limit` characters, preferring to break at a line boundary.
+    """
+    if len(text) <= limit:
+        return text
+    
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut if cut > 0 else limit]
+
+
+# --- Prompt Templates ---
+# Static text goes first and is byte-identical on every call so providers that cache
+# prompt prefixes (OpenAI, OpenRouter, Anthropic) can reuse it; anything page-specific
+# (title, text) must stay at the end. Editing these strings invalidates cached prefixes.
+SUMMARY_SYSTEM_PROMPT = (
+    "You are an assistant that analyzes the contents of a website or web application "
+    "and provides a comprehensive summary of the website's content, ignoring navigation "
+    "elements and focusing on the main information. Respond in markdown format with "
+    "clear headings and bullet points."
+)
+SUMMARY_INSTRUCTIONS = (
+    "Please provide a detailed summary of the following website in markdown. "
+    "If it includes news or announcements, then summarize these too. "
+    "Focus on the main content and key information.\n\n"
+)
+
+
+def build_prompts(text: str, title: str) -> Tuple[str, str]:
+    """
+    Build the system and user prompts used to summarize a scraped page.
+    The page text is truncated to MAX_PROMPT_CHARS to bound token usage.
+    """
+    text = truncate_text(text)
+    
+    # Static instructions first, variable page content last (see Prompt Templates above)
+    user_prompt = (
+        f"{SUMMARY_INSTRUCTIONS}"
+        f"Website title: '{title}'\n\n"
+        "Website contents:\n"
+        f"{text}"
+    )
+    
+    return SUMMARY_SYSTEM_PROMPT, user_prompt
 
 
-def summarize_content(text: str, title: str, provider: str, model_name: str) -> str:
+def make_cache_key(*parts: Any) -> str:
+    """SHA-256 of the orjson-serialized parts; used to key cached completions and model lists."""
+    return hashlib.sha256(orjson.dumps(parts)).hexdigest()
+
+
+def load_cached_completion(cache_key: str) -> Optional[str]:
+    """
+    Returns the stored summary for a make_cache_key() key, or None on a miss, an
+    entry older than COMPLETION_CACHE_TTL, or an unavailable cache.
+    """
+    try:
+        with closing(_connect_cache_db()) as conn:
+            row = conn.execute(
+                "SELECT summary FROM completions WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, time.time() - COMPLETION_CACHE_TTL)
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+    return row[0] if row else None
+
+def store_cached_completion(cache_key: str, summary: str):
+    """
+    Records a finished summary, then drops expired entries and all but the newest
+    COMPLETION_CACHE_MAX_ENTRIES. Cache failures are ignored.
+    """
+    now = time.time()
+    try:
+        with closing(_connect_cache_db()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO completions (cache_key, summary, created_at) VALUES (?, ?, ?)",
+                (cache_key, summary, now)
+            )
+            conn.execute(
+                "DELETE FROM completions WHERE created_at < ? OR cache_key NOT IN "
+                "(SELECT cache_key FROM completions ORDER BY created_at DESC LIMIT ?)",
+                (now - COMPLETION_CACHE_TTL, COMPLETION_CACHE_MAX_ENTRIES)
+            )
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def load_cached_models(cache_key: str) -> Optional[List[str]]:
+    """
+    Returns the stored model list for a make_cache_key() key, or None on a miss, a
+    list older than MODEL_LIST_REFRESH, or an unavailable cache.
+    """
+    try:
+        with closing(_connect_cache_db()) as conn:
+            row = conn.execute(
+                "SELECT models FROM model_lists WHERE cache_key = ? AND fetched_at >= ?",
+                (cache_key, time.time() - MODEL_LIST_REFRESH)
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+    return orjson.loads(row[0]) if row else None
+
+def store_cached_models(cache_key: str, models: List[str]):
+    """Records a fetched model list and prunes expired ones. Cache failures are ignored."""
+    now = time.time()
+    try:
+        with closing(_connect_cache_db()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO model_lists (cache_key, models, fetched_at) VALUES (?, ?, ?)",
+                (cache_key, orjson.dumps(models), now)
+            )
+            conn.execute("DELETE FROM model_lists WHERE fetched_at < ?", (now - MODEL_LIST_REFRESH,))
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def summarize_content(
+    text: str,
+    title: str,
+    provider: str,
+    model_name: str,
+    api_key: Optional[str] = None
+) -> Iterator[str]:
     """
     Generate summary using the selected LLM backend, model, and configuration.
+    Yields the summary incrementally as tokens arrive; identical requests are
+    replayed from the completion cache in a single chunk.
+    Pass an already-resolved api_key to skip the key lookup for remote providers.
     """
     
     # 1. Determine API client configuration
@@ -208,57 +910,78 @@ def summarize_content(text: str, title: str, provider: str, model_name: str) ->
     if not config:
         raise ValueError(f"Unsupported provider: {provider}")
 
-    base_url = config.get("base_url")
-    api_key = None
+    base_url = config.base_url
     
-    if config["is_remote"]:
-        api_key = get_api_key(provider) # Will raise RuntimeError if key is missing
+    if config.is_remote:
+        api_key = api_key or get_api_key(provider) # Will raise RuntimeError if key is missing
         
         # If the user selected Ollama as a remote provider but failed to set a URL, 
         # we still need to set the base_url for the client, so we use the session state URL.
-        client = OpenAI(api_key=api_key, base_url=base_url)
+        client = get_llm_client(provider, base_url, api_key)
     
     else: # Ollama (Local)
         base_url = st.session_state["endpoint_url"]
         # Ollama typically ignores the API key, but the client requires a non-None value
-        client = OpenAI(base_url=base_url, api_key="ollama_local_key") 
+        client = get_llm_client(provider, base_url, "ollama_local_key")
     
     # 2. Build prompts
-    system_prompt = (
-        "You are an assistant that analyzes the contents of a website or web application "
-        "and provides a comprehensive summary of the website's content, ignoring navigation "
-        "elements and focusing on the main information. Respond in markdown format with "
-        "clear headings and bullet points."
+    system_prompt, user_prompt = build_prompts(text, title)
+    temperature, max_tokens = 0.3, 1000
+    # Provider and base_url are part of the key so different backends never share entries
+    cache_key = make_cache_key(
+        provider, base_url, model_name, system_prompt, user_prompt, temperature, max_tokens
     )
     
-    user_prompt = (
-        f"You are looking at a website titled '{title}'\n\n"
-        "The contents of this website are as follows; please provide a detailed summary "
-        "of this website in markdown. If it includes news or announcements, then "
-        "summarize these too. Focus on the main content and key information.\n\n"
-        f"{text}"
-    )
+    cached_summary = load_cached_completion(cache_key)
+    if cached_summary is not None:
+        yield cached_summary
+        return
     
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt}
     ]
     
-    # 3. Call API
-    response = client.chat.completions.create(
+    # 3. Call API, streaming tokens through as they arrive
+    stream = client.chat.completions.create(
         model=model_name,
         messages=messages,
-        temperature=0.3,
-        max_tokens=1000
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True
     )
     
-    return response.choices[0].message.content
+    chunks = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content:
+            chunks.append(content)
+            yield content
+    
+    # Only complete, non-empty responses are cached
+    if chunks:
+        store_cached_completion(cache_key, "".join(chunks))
 
 
 # -----------------------------
 # UI Component Functions
 # -----------------------------
 
+@st.fragment(run_every=0.5)
+def await_model_list(future: Future):
+    """
+    Polls a pending model-list fetch without blocking the rest of the page and
+    reruns the app once it finishes so the selectbox picks up the result.
+    Never reruns over a page showing Generate output (see main): that run's list
+    is picked up on the user's next interaction instead.
+    """
+    if not future.done():
+        st.caption("⏳ Loading models...")
+    elif not st.session_state.get("summary_requested"):
+        st.rerun()
+
 def llm_config_selector():
     st.subheader("🤖 LLM Backend Setup")
     
@@ -272,25 +995,50 @@ def llm_config_selector():
     
     config = LLM_CONFIGS[provider]
     
-    if config["is_remote"]:
+    if config.is_remote:
         # 2a. Remote Provider Key Input (OpenAI/OpenRouter)
         st.text_input(
             f"Paste your {provider} API Key here:",
             type="password",
             key="api_key",
-            help=f"Your key is only stored in the current browser session and is never saved. Reads from {config['secret_key_name']} in secrets.toml if empty."
+            help=f"Your key is only stored in the current browser session and is never saved. Reads from {config.secret_key_name} in secrets.toml if empty."
         )
 
         try:
             current_key = get_api_key(provider)
             st.info(f"Key Status: **✅ Key Loaded** (via session or secrets)")
             
-            # 3a. Dynamic Model Loading for Remote Providers
-            with st.spinner(f"Fetching models from {provider}..."):
-                model_options = fetch_available_models(provider, current_key)
+            # 3a. Dynamic Model Loading for Remote Providers (started in the background by main)
+            future = prefetch_models(provider, current_key)
+            last_options = st.session_state.get("model_options")
+            if not future.done():
+                # Don't block the page on the API: keep offering the last list for this
+                # provider (so the current selection survives) until the new one arrives
+                if last_options and last_options[0] == provider:
+                    model_options = last_options[1]
+                else:
+                    model_options = [config.default_model]
+                await_model_list(future)
+            else:
+                model_options = []
+                if future.exception() is not None:
+                    # Report the failure once; the next interaction starts a fresh fetch
+                    st.session_state.pop("models_future", None)
+                try:
+                    model_options = future.result()
+                except APITimeoutError:
+                    st.warning(f"Timed out fetching models from {provider}. Using the default model.")
+                except APIConnectionError as e:
+                    st.warning(f"Could not connect to {provider} to fetch models: {e}")
+                except APIError as e:
+                    # Catch authentication/rate limit errors
+                    st.warning(f"Could not fetch models for {provider}. Check API key validity. Error Code: {getattr(e, 'status_code', 'n/a')}")
+                except Exception as e:
+                    st.warning(f"An unexpected error occurred while fetching models: {str(e) or type(e).__name__}")
 
             if not model_options:
-                model_options = [config["default_model"], "--- Could not load models ---"]
+                model_options = [config.default_model, "--- Could not load models ---"]
+            st.session_state["model_options"] = (provider, model_options)
                 
             st.selectbox(
                 "Select Model:",
@@ -301,10 +1049,10 @@ def llm_config_selector():
             )
         except RuntimeError:
             st.error("Key Status: ❌ Key Missing")
-            st.session_state["selected_model"] = config["default_model"]
+            st.session_state["selected_model"] = config.default_model
             st.selectbox(
                 "Select Model:",
-                options=[config["default_model"], "--- Please load key first ---"],
+                options=[config.default_model, "--- Please load key first ---"],
                 key="selected_model",
                 index=0,
                 disabled=True
@@ -314,7 +1062,7 @@ def llm_config_selector():
         # 2b. Ollama Endpoint URL Input
         st.text_input(
             "Ollama Endpoint URL",
-            value=config["base_url"],
+            value=config.base_url,
             key="endpoint_url",
             help="The URL for your local Ollama server (e.g., http://localhost:11434/v1)"
         )
@@ -322,14 +1070,78 @@ def llm_config_selector():
         # 3b. Static Model Name Input for Ollama
         st.text_input(
             "Model Name (in Ollama)",
-            value=config["default_model"],
+            value=config.default_model,
             key="selected_model",
             help="Enter the exact name of the model installed in Ollama (e.g., llama2, mistral)"
         )
         st.info("Ollama does not require an external API key.")
 
 
+def render_scrape_result(
+    scraped_data: Dict[str, Any],
+    provider: str,
+    model_name: str,
+    api_key: Optional[str] = None
+):
+    """Display one scraped page and generate its summary."""
+    if scraped_data["status"] == "error":
+        st.markdown(f'<div class="error-container">❌ **Scraping Failed** ({scraped_data["url"]}): {scraped_data["error"]}</div>', unsafe_allow_html=True)
+        return
+    
+    st.markdown(f'<div class="success-container">✅ **Successfully scraped:** {scraped_data["title"]}</div>', unsafe_allow_html=True)
+    
+    # Display raw content in expander
+    with st.expander(f"📄 Raw Scraped Content — {scraped_data['url']}", expanded=False):
+        st.text_area(
+            "Cleaned text content",
+            value=scraped_data["text"],
+            height=300,
+            disabled=True,
+            key=f"raw_{scraped_data['url']}"
+        )
+    
+    # 2. Summarization phase
+    st.subheader("🤖 AI Summary Generation")
+    
+    if len(scraped_data["text"]) > MAX_PROMPT_CHARS:
+        st.info(
+            f"ℹ️ Page text is {len(scraped_data['text']):,} characters; only the first "
+            f"~{MAX_PROMPT_CHARS:,} are sent to the model."
+        )
+    
+    st.caption(f"Generating summary using **{provider}** and model **{model_name}**...")
+    try:
+        # Display summary, rendering tokens as they stream in
+        st.markdown('<div class="summary-container">', unsafe_allow_html=True)
+        st.markdown("## 📋 AI-Generated Summary")
+        st.write_stream(
+            summarize_content(
+                text=scraped_data["text"],
+                title=scraped_data["title"],
+                provider=provider,
+                model_name=model_name,
+                api_key=api_key
+            )
+        )
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+    except Exception as e:
+        st.markdown(f'<div class="error-container">❌ **Error generating summary:** {str(e)}</div>', unsafe_allow_html=True)
+
+
 def main():
+    # Holds off await_model_list's app rerun while this run is in progress; reset
+    # below once we know whether the run renders Generate output worth keeping
+    st.session_state["summary_requested"] = True
+    
+    # Kick off the model-list refresh first so it overlaps with rendering the page
+    provider = st.session_state["llm_provider"]
+    if LLM_CONFIGS[provider].is_remote:
+        try:
+            prefetch_models(provider, get_api_key(provider))
+        except RuntimeError:
+            pass # Missing key is reported by llm_config_selector
+    
     # Header
     st.markdown('<div class="main-header">', unsafe_allow_html=True)
     st.title("🔗 Website Scraper & Summarizer")
@@ -345,16 +1157,34 @@ def main():
         
         st.markdown("---")
         
-        # URL input
-        url = st.text_input(
-            "Target Website URL",
-            value=st.session_state.get("url", "https://streamlit.io/"),
-            placeholder="https://example.com",
-            help="Enter the URL of the website you want to summarize"
+        batch_mode = st.checkbox(
+            "Batch mode",
+            key="batch_mode",
+            help="Summarize several websites at once; pages are fetched concurrently."
         )
         
-        # Store URL in session state
-        st.session_state.url = url
+        # URL input
+        if batch_mode:
+            url = st.text_area(
+                "Target Website URLs (one per line)",
+                value=st.session_state.get("urls", "https://streamlit.io/\nhttps://docs.streamlit.io/"),
+                placeholder="https://example.com\nhttps://example.org",
+                help="Enter one URL per line"
+            )
+            st.session_state.urls = url
+            # De-duplicate while keeping the user's order
+            urls = list(dict.fromkeys(line.strip() for line in url.splitlines() if line.strip()))
+        else:
+            url = st.text_input(
+                "Target Website URL",
+                value=st.session_state.get("url", "https://streamlit.io/"),
+                placeholder="https://example.com",
+                help="Enter the URL of the website you want to summarize"
+            )
+            
+            # Store URL in session state
+            st.session_state.url = url
+            urls = [url.strip()] if url.strip() else []
         
         # Generate button
         generate_summary = st.button(
@@ -362,69 +1192,46 @@ def main():
             type="primary",
             use_container_width=True
         )
+        st.session_state["summary_requested"] = generate_summary
     
     # --- Main content area ---
     
-    if generate_summary and url:
-        # Validate URL
-        if not url.startswith(("http://", "https://")):
-            st.error("❌ Please enter a valid URL starting with http:// or https://")
-            return
+    if generate_summary and urls:
+        # Validate a single URL up front; batch mode validates each URL concurrently
+        # in _fetch_one and reports failures per URL
+        if len(urls) == 1:
+            try:
+                validate_url(urls[0])
+            except ValueError as e:
+                st.error(f"❌ {str(e)}")
+                return
         
         # Check LLM configuration validity before starting the scrape
         provider = st.session_state["llm_provider"]
         model_name = st.session_state["selected_model"]
         
-        if LLM_CONFIGS[provider]["is_remote"]:
+        # Resolve the key once here and hand it down to every summarization call
+        api_key = None
+        if LLM_CONFIGS[provider].is_remote:
             try:
-                get_api_key(provider) # Check if key is available
+                api_key = get_api_key(provider)
             except RuntimeError as e:
                 st.markdown(f'<div class="error-container">❌ **LLM Configuration Error:** {str(e)}</div>', unsafe_allow_html=True)
                 return
 
         # 1. Scraping phase
         st.subheader("📥 Scraping Website Content")
-        with st.spinner(f"Scraping content from {url}..."):
-            # Removed caching call here
-            scraped_data = scrape_and_clean(url)
-        
-        if scraped_data["status"] == "error":
-            st.markdown(f'<div class="error-container">❌ **Scraping Failed:** {scraped_data["error"]}</div>', unsafe_allow_html=True)
-            return
+        if len(urls) == 1:
+            with st.spinner(f"Scraping content from {urls[0]}..."):
+                results = [scrape_and_clean(urls[0])]
+        else:
+            with st.spinner(f"Scraping {len(urls)} websites concurrently..."):
+                results = scrape_many(urls)
         
-        st.markdown(f'<div class="success-container">✅ **Successfully scraped:** {scraped_data["title"]}</div>', unsafe_allow_html=True)
-        
-        # Display raw content in expander
-        with st.expander("📄 Raw Scraped Content", expanded=False):
-            st.text_area(
-                "Cleaned text content",
-                value=scraped_data["text"],
-                height=300,
-                disabled=True
-            )
-        
-        # 2. Summarization phase
-        st.subheader("🤖 AI Summary Generation")
-        
-        with st.spinner(f"Generating summary using **{provider}** and model **{model_name}**..."):
-            try:
-                summary = summarize_content(
-                    text=scraped_data["text"],
-                    title=scraped_data["title"],
-                    provider=provider,
-                    model_name=model_name
-                )
-                
-                # Display summary
-                st.markdown('<div class="summary-container">', unsafe_allow_html=True)
-                st.markdown("## 📋 AI-Generated Summary")
-                st.markdown(summary)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            except Exception as e:
-                st.markdown(f'<div class="error-container">❌ **Error generating summary:** {str(e)}</div>', unsafe_allow_html=True)
+        for scraped_data in results:
+            render_scrape_result(scraped_data, provider, model_name, api_key)
 
-    elif generate_summary and not url:
+    elif generate_summary and not urls:
         st.warning("⚠️ Please enter a URL to summarize")
     
     # Instructions when no action taken